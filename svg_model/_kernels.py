@@ -0,0 +1,150 @@
+# coding: utf-8
+"""
+Compiled kernels for tight numeric loops.
+
+Kernels are compiled with `numba <https://numba.pydata.org>`_ if it is
+installed.  Otherwise, :data:`NUMBA_AVAILABLE` is ``False`` and callers
+should prefer their vectorized NumPy implementations.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        # Leave functions uncompiled, supporting both `@njit` and `@njit(...)`.
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+
+# Integer code for each supported SVG path command.
+PATH_MOVE, PATH_LINE, PATH_H, PATH_V, PATH_CLOSE, PATH_LINE_REL, PATH_H_REL, PATH_V_REL = range(8)
+PATH_COMMAND_CODES = {'M': PATH_MOVE, 'L': PATH_LINE, 'H': PATH_H, 'V': PATH_V, 'Z': PATH_CLOSE,
+                      'z': PATH_CLOSE, 'l': PATH_LINE_REL, 'h': PATH_H_REL, 'v': PATH_V_REL}
+
+
+@njit(cache=True)
+def walk_path(cmd_codes: np.ndarray, nums: np.ndarray, offsets: np.ndarray, out_xy: np.ndarray) -> int:
+    """
+    Resolve the points of a tokenized SVG path.
+
+    Parameters
+    ----------
+    cmd_codes : numpy.ndarray
+        Code (see :data:`PATH_COMMAND_CODES`) of each path command.
+    nums : numpy.ndarray
+        Values of all path commands, concatenated.
+    offsets : numpy.ndarray
+        Start index of the values of each command in :data:`nums`, followed
+        by ``len(nums)``.
+    out_xy : numpy.ndarray
+        Output array of shape ``(2, <number of points>)``, filled with the
+        ``x`` and ``y`` coordinate of each point.
+
+    Returns
+    -------
+    int
+        Number of points written to :data:`out_xy`.
+    """
+    x = y = x0 = y0 = np.nan
+    i = 0
+    for k in range(cmd_codes.shape[0]):
+        code = cmd_codes[k]
+        if code == PATH_CLOSE:
+            x = x0
+            y = y0
+            out_xy[0, i] = x
+            out_xy[1, i] = y
+            i += 1
+            continue
+        arity = 2 if code == PATH_MOVE or code == PATH_LINE or code == PATH_LINE_REL else 1
+        # Values beyond the first group are implicit repeats of the command.
+        for j in range(offsets[k], offsets[k + 1] - arity + 1, arity):
+            if code == PATH_MOVE or code == PATH_LINE:
+                x = nums[j]
+                y = nums[j + 1]
+                if np.isnan(x0):
+                    x0 = x
+                    y0 = y
+            elif code == PATH_H:
+                x = nums[j]
+            elif code == PATH_V:
+                y = nums[j]
+            elif code == PATH_LINE_REL:
+                x += nums[j]
+                y += nums[j + 1]
+            elif code == PATH_H_REL:
+                x += nums[j]
+            else:
+                y += nums[j]
+            out_xy[0, i] = x
+            out_xy[1, i] = y
+            i += 1
+    return i
+
+
+@njit(cache=True, fastmath=True)
+def shoelace(x: np.ndarray, y: np.ndarray) -> tuple:
+    """
+    Compute the (shoelace) sums of the area, centroid and moment of a loop in
+    a single pass.
+
+    Parameters
+    ----------
+    x, y : numpy.ndarray
+        Coordinates of the loop vertices.
+
+    Returns
+    -------
+    tuple
+        Twice the signed area, the ``x`` and ``y`` centroid sums (before
+        scaling by ``6 * area``), and the moment sum (before dividing by 12).
+    """
+    double_area = x_sum = y_sum = moment_sum = 0.0
+    n = x.shape[0]
+    for i in range(n):
+        j = i + 1 if i + 1 < n else 0
+        # Accumulate in double precision, regardless of the storage type.
+        x_i, y_i, x_j, y_j = np.float64(x[i]), np.float64(y[i]), np.float64(x[j]), np.float64(y[j])
+        factor = x_j * y_i - x_i * y_j
+        double_area += factor
+        x_sum += (x_i + x_j) * factor
+        y_sum += (y_i + y_j) * factor
+        moment_sum += factor * (x_i * x_i + x_j * x_i + x_i * x_j + x_j * x_j
+                                + y_i * y_i + y_j * y_i + y_i * y_j + y_j * y_j)
+    return double_area, x_sum, y_sum, moment_sum
+
+
+@njit(cache=True, parallel=True)
+def shoelace_loops(x: np.ndarray, y: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Compute the :func:`shoelace` sums of several loops in parallel.
+
+    Parameters
+    ----------
+    x, y : numpy.ndarray
+        Coordinates of the vertices of all loops, concatenated.
+    offsets : numpy.ndarray
+        Start index of the vertices of each loop, followed by ``len(x)``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``(<number of loops>, 4)``, containing the
+        :func:`shoelace` sums of each loop.
+    """
+    loop_count = offsets.shape[0] - 1
+    sums = np.empty((loop_count, 4))
+    for k in prange(loop_count):
+        start, stop = offsets[k], offsets[k + 1]
+        double_area, x_sum, y_sum, moment_sum = shoelace(x[start:stop], y[start:stop])
+        sums[k, 0] = double_area
+        sums[k, 1] = x_sum
+        sums[k, 2] = y_sum
+        sums[k, 3] = moment_sum
+    return sums
@@ -1,5 +1,4 @@
 # coding: utf-8
-import re
 
 
 def hex_color_to_rgba(hex_color: str, normalize_to: int = 255) -> tuple:
@@ -17,16 +16,26 @@ def hex_color_to_rgba(hex_color: str, normalize_to: int = 255) -> tuple:
         (tuple) : RGBA tuple (i.e., `(<r>, <g>, <b>, <a>)`), where range of
             each channel in tuple is `[0, normalize_to]`.
     """
-    color_pattern = re.compile(r'#(?P<R>[\da-fA-F]{1,2})(?P<G>[\da-fA-F]{1,2})'
-                               r'(?P<B>[\da-fA-F]{1,2})(?P<A>[\da-fA-F]{1,2})?')
+    digits = hex_color[1:] if hex_color[:1] == '#' else ''
 
-    match = color_pattern.match(hex_color)
-
-    if not match:
+    if not (len(digits) in (3, 4, 6, 8) and digits.isascii() and digits.isalnum()):
         raise ValueError('Color string must be in format #RGB[A] or '
                          '#RRGGBB[AA] (alpha channel is optional)')
-
-    channels = match.groupdict()
-    scale = normalize_to / 255
-
-    return tuple(int(ch, 16) * scale if ch else None for ch in channels.values())
+    try:
+        value = int(digits, 16)
+    except ValueError:
+        raise ValueError('Color string must be in format #RGB[A] or '
+                         '#RRGGBB[AA] (alpha channel is optional)') from None
+
+    # Unpack each channel from the bits of the parsed number; single hex
+    # digit channels (i.e., `#RGB[A]`) are expanded (e.g., `f` -> `ff`).
+    if len(digits) < 6:
+        bits, expand = 4, 17
+    else:
+        bits, expand = 8, 1
+    count = len(digits) * 4 // bits
+    scale = expand * normalize_to / 255
+    channels = tuple(((value >> (bits * (count - 1 - i))) & ((1 << bits) - 1)) * scale
+                     for i in range(count))
+
+    return channels if count == 4 else channels + (None, )
@@ -3,6 +3,7 @@
 # Jerry Zhou <jerryzhou@hotmail.ca> and Christian Fobel <christian@fobel.net>
 import re
 import warnings
+from itertools import chain
 from typing import Dict, Tuple, Optional
 
 import pandas as pd
@@ -11,10 +12,16 @@ import numpy as np
 from io import StringIO
 from lxml import etree
 
-from . import INKSCAPE_NSMAP
+from . import INKSCAPE_NSMAP, iterparse_elements
 from .draw import draw_lines_svg_layer as _draw_lines_svg_layer
 from .shapes_canvas import ShapesCanvas
 
+# Start and end coordinates of a connection `svg:path`.
+cre_path_ends = re.compile(r'^\s*M\s*(?P<start_x>\d+(\.\d+)?),\s*(?P<start_y>\d+(\.\d+)?)'
+                           r'.*((L\s*(?P<end_x>\d+(\.\d+)?),\s*(?P<end_y>\d+(\.\d+)?))|'
+                           r'(V\s*(?P<end_vy>\d+(\.\d+)?))|'
+                           r'(H\s*(?P<end_hx>\d+(\.\d+)?)))\D*$')
+
 
 def extend_shapes(df_shapes: pd.DataFrame, axis: str, distance: float) -> pd.DataFrame:
     """
@@ -59,45 +66,37 @@ def extract_adjacent_shapes(df_shapes: pd.DataFrame, shape_i_column: str, extend
         The ``source`` and ``target`` of each adjacency connection is ordered
         such that the ``source`` is less than the ``target``.
     """
-    # Find corners of each solid shape outline.
-    # Extend x coords by abs units
-    df_scaled_x = extend_shapes(df_shapes, 'x', extend)
-    # Extend y coords by abs units
-    df_scaled_y = extend_shapes(df_shapes, 'y', extend)
-
-    df_corners = df_shapes.groupby(shape_i_column).agg({'x': ['min', 'max'],
-                                                        'y': ['min', 'max']})
-
-    # Find adjacent electrodes
-    row_list = []
-
-    for shapeNumber in df_shapes[shape_i_column].drop_duplicates():
-        df_stretched = df_scaled_x[df_scaled_x[shape_i_column].isin([shapeNumber])]
-        xmin_x, xmax_x, ymin_x, ymax_x = (df_stretched.x.min(), df_stretched.x.max(),
-                                          df_stretched.y.min(), df_stretched.y.max())
-        df_stretched = df_scaled_y[df_scaled_y[shape_i_column].isin([shapeNumber])]
-        xmin_y, xmax_y, ymin_y, ymax_y = (df_stretched.x.min(), df_stretched.x.max(),
-                                          df_stretched.y.min(), df_stretched.y.max())
-
-        adjacent = df_corners[((df_corners.x['min'] < xmax_x) & (df_corners.x['max'] >= xmax_x)
-                               | (df_corners.x['min'] < xmin_x) & (df_corners.x['max'] >= xmin_x))
-                              & (df_corners.y['min'] < ymax_x) & (df_corners.y['max'] > ymin_x) |
-
-                              ((df_corners.y['min'] < ymax_y) & (df_corners.y['max'] >= ymax_y)
-                               | (df_corners.y['min'] < ymin_y) & (df_corners.y['max'] >= ymin_y))
-                              & ((df_corners.x['min'] < xmax_y) & (df_corners.x['max'] > xmin_y))
-                              ].index.values
-
-        for shape in adjacent:
-            temp_dict = {'source': shapeNumber, 'target': shape}
-            reverse_dict = {'source': shape, 'target': shapeNumber}
-
-            if reverse_dict not in row_list:
-                row_list.append(temp_dict)
-
-    df_connected = (pd.DataFrame(row_list)[['source', 'target']]
-                    .sort_index(axis=1, ascending=True)
-                    .sort_values(['source', 'target']))
+    # Find corners of each solid shape outline, reducing over the contiguous
+    # vertex rows of each shape (shape keys are sorted, as with `groupby`).
+    # Missing coordinates are skipped (`fmin`/`fmax`), as with `groupby`.
+    codes, shape_keys = pd.factorize(df_shapes[shape_i_column], sort=True)
+    order = np.argsort(codes, kind='stable')
+    starts = np.searchsorted(codes[order], np.arange(len(shape_keys)))
+    xy = df_shapes[['x', 'y']].values[order]
+    (xmin, ymin), (xmax, ymax) = np.fmin.reduceat(xy, starts).T, np.fmax.reduceat(xy, starts).T
+    # Extend x coords (and, separately, y coords) by abs units.
+    xmin_x, xmax_x = xmin - extend, xmax + extend
+    ymin_y, ymax_y = ymin - extend, ymax + extend
+
+    # Find adjacent shapes, comparing every (stretched) shape (rows) against
+    # every other shape (columns) at once through broadcasting.
+    # A shape is adjacent if it straddles a stretched edge of the other shape.
+    adjacent_x = (((xmin[None, :] < xmax_x[:, None]) & (xmax[None, :] >= xmax_x[:, None]) |
+                   (xmin[None, :] < xmin_x[:, None]) & (xmax[None, :] >= xmin_x[:, None])) &
+                  (ymin[None, :] < ymax[:, None]) & (ymax[None, :] > ymin[:, None]))
+    adjacent_y = (((ymin[None, :] < ymax_y[:, None]) & (ymax[None, :] >= ymax_y[:, None]) |
+                   (ymin[None, :] < ymin_y[:, None]) & (ymax[None, :] >= ymin_y[:, None])) &
+                  (xmin[None, :] < xmax[:, None]) & (xmax[None, :] > xmin[:, None]))
+    adjacent = adjacent_x | adjacent_y
+    # Connections are undirected, so keep each pair once, ordered such that the
+    # source is less than the target (shape keys are sorted).
+    adjacent |= adjacent.T
+    source_i, target_i = np.triu_indices(adjacent.shape[0], k=1)
+    connected = adjacent[source_i, target_i]
+
+    shape_keys = np.asarray(shape_keys)
+    df_connected = pd.DataFrame({'source': shape_keys[source_i[connected]],
+                                 'target': shape_keys[target_i[connected]]})
     return df_connected
 
 
@@ -115,10 +114,12 @@ def get_adjacency_matrix(df_connected: pd.DataFrame) -> Tuple[np.ndarray, pd.Ser
     path_indexes = pd.Series(indexed_paths.index, index=sorted_path_keys)
 
     adjacency_matrix = np.zeros((path_indexes.shape[0],) * 2, dtype=np.intp)
-    for i_key, j_key in df_connected[['source', 'target']].values:
-        i, j = path_indexes.loc[[i_key, j_key]]
-        adjacency_matrix[i, j] = 1
-        adjacency_matrix[j, i] = 1
+    # Look up matrix index of all sources/targets at once and set both
+    # directions of each connection with a single scatter.
+    i = path_indexes.index.get_indexer(df_connected['source'].values)
+    j = path_indexes.index.get_indexer(df_connected['target'].values)
+    adjacency_matrix[i, j] = 1
+    adjacency_matrix[j, i] = 1
     return adjacency_matrix, indexed_paths, path_indexes
 
 
@@ -134,6 +135,9 @@ def extract_connections(svg_source: str, shapes_canvas: ShapesCanvas, line_layer
     ----------
     svg_source : filepath
         Input SVG file containing connection lines.
+
+        If neither :data:`line_xpath` nor :data:`path_xpath` are specified,
+        the SVG source is streamed, rather than loading the whole document.
     shapes_canvas : shapes_canvas.ShapesCanvas
         Shapes canvas containing shapes to compare against connection
         endpoints.
@@ -166,33 +170,47 @@ def extract_connections(svg_source: str, shapes_canvas: ShapesCanvas, line_layer
         # Inkscape-specific SVG tags and attributes (e.g., `inkscape:label`).
         namespaces = INKSCAPE_NSMAP
 
-    # Parse SVG source.
-    e_root = etree.parse(svg_source)
-    # List to hold records of form: `[<id>, <x1>, <y1>, <x2>, <y2>]`.
-    frames = []
+    svg_tags = {tag: f'{{{namespaces["svg"]}}}{tag}' for tag in ('g', 'line', 'path')}
     coords_columns = ['x1', 'y1', 'x2', 'y2']
 
-    if line_xpath is None:
-        # Define a query to look for `svg:line` elements in the top level of layer of
-        # SVG specified to contain connections.
-        line_xpath = f"//svg:g[@inkscape:label='{line_layer}']/svg:line"
-
-    for line_i in e_root.xpath(line_xpath, namespaces=namespaces):
-        line_i_dict = dict(line_i.items())
-        values = [line_i_dict.get('id', None)] + [float(line_i_dict[k]) for k in coords_columns]
-        frames.append(values)
-
-    cre_path_ends = re.compile(r'^\s*M\s*(?P<start_x>\d+(\.\d+)?),\s*(?P<start_y>\d+(\.\d+)?)'
-                               r'.*((L\s*(?P<end_x>\d+(\.\d+)?),\s*(?P<end_y>\d+(\.\d+)?))|'
-                               r'(V\s*(?P<end_vy>\d+(\.\d+)?))|'
-                               r'(H\s*(?P<end_hx>\d+(\.\d+)?)))\D*$')
-
-    if path_xpath is None:
-        path_xpath = f"//svg:g[@inkscape:label='{line_layer}']/svg:path"
-
-    for path_i in e_root.xpath(path_xpath, namespaces=namespaces):
-        path_i_dict = dict(path_i.items())
-        match_i = cre_path_ends.match(path_i_dict['d'])
+    if line_xpath is None and path_xpath is None:
+        # Stream through SVG source (rather than loading the whole document)
+        # and select `svg:line` and `svg:path` elements in the top level of
+        # layer of SVG specified to contain connections.
+        label_attr = f'{{{namespaces["inkscape"]}}}label'
+
+        def _iter_connection_elements():
+            for element in iterparse_elements(svg_source, [svg_tags['line'], svg_tags['path']]):
+                layer = element.getparent()
+                if layer is not None and layer.tag == svg_tags['g'] and layer.get(label_attr) == line_layer:
+                    yield element.tag == svg_tags['line'], element
+
+        elements = _iter_connection_elements()
+    else:
+        # Parse SVG source.
+        e_root = etree.parse(svg_source)
+
+        if line_xpath is None:
+            # Define a query to look for `svg:line` elements in the top level of layer of
+            # SVG specified to contain connections.
+            line_xpath = f"//svg:g[@inkscape:label='{line_layer}']/svg:line"
+        if path_xpath is None:
+            path_xpath = f"//svg:g[@inkscape:label='{line_layer}']/svg:path"
+
+        elements = chain(((True, line_i) for line_i in e_root.xpath(line_xpath, namespaces=namespaces)),
+                         ((False, path_i) for path_i in e_root.xpath(path_xpath, namespaces=namespaces)))
+
+    # Lists to hold records of form: `[<id>, <x1>, <y1>, <x2>, <y2>]`.
+    line_frames = []
+    path_frames = []
+
+    for is_line, element in elements:
+        if is_line:
+            values = [element.get('id')] + [float(element.get(k)) for k in coords_columns]
+            line_frames.append(values)
+            continue
+
+        match_i = cre_path_ends.match(element.get('d'))
         if match_i:
             # Connection `svg:path` matched required format.  Extract start and
             # end coordinates.
@@ -206,23 +224,23 @@ def extract_connections(svg_source: str, shapes_canvas: ShapesCanvas, line_layer
                 match_dict_i['end_x'] = match_dict_i['end_hx']
                 match_dict_i['end_y'] = match_dict_i['start_y']
             # Append record for end points of the current path.
-            frames.append([path_i_dict['id']] + list(map(float, (match_dict_i['start_x'],
-                                                                 match_dict_i['start_y'],
-                                                                 match_dict_i['end_x'],
-                                                                 match_dict_i['end_y']))))
+            path_frames.append([element.get('id')] + list(map(float, (match_dict_i['start_x'],
+                                                                     match_dict_i['start_y'],
+                                                                     match_dict_i['end_x'],
+                                                                     match_dict_i['end_y']))))
 
+    frames = line_frames + path_frames
     if not frames:
         return pd.DataFrame(None, columns=['source', 'target'])
 
     df_connection_lines = pd.DataFrame(frames, columns=['id'] + coords_columns)
 
-    # Use `shapes_canvas.find_shape` to determine shapes overlapped by end
+    # Use `shapes_canvas.find_shapes` to determine shapes overlapped by end
     # points of each `svg:path` or `svg:line`.
-    df_shape_connections_i = pd.DataFrame([[shapes_canvas.find_shape(x1, y1),
-                                            shapes_canvas.find_shape(x2, y2)]
-                                           for i, (x1, y1, x2, y2) in
-                                           df_connection_lines[coords_columns].iterrows()],
-                                          columns=['source', 'target'])
+    df_shape_connections_i = pd.DataFrame({'source': shapes_canvas.find_shapes(*df_connection_lines[['x1', 'y1']]
+                                                                               .values.T),
+                                           'target': shapes_canvas.find_shapes(*df_connection_lines[['x2', 'y2']]
+                                                                               .values.T)})
     # Order the source and target of each row so the source shape identifier is
     # always the lowest.
     df_shape_connections_i = df_shape_connections_i.sort_index(axis=1)
@@ -3,18 +3,13 @@ import re
 import warnings
 from typing import List, Dict, Optional, Tuple, Union
 
-from .data_frame import get_bounding_boxes
+from . import _kernels
 
-from io import StringIO
+from io import StringIO, TextIOBase
 from lxml import etree
+import numpy as np
 import pandas as pd
 
-try:
-    from nadamq import ureg
-except ModuleNotFoundError:
-    import pint
-    ureg = pint.UnitRegistry()
-
 from ._version import get_versions
 
 __version__ = get_versions()['version']
@@ -26,25 +21,23 @@ INKSCAPE_NSMAP = NSMAP.copy()
 INKSCAPE_NSMAP['inkscape'] = 'https://www.inkscape.org/namespaces/inkscape'
 
 INKSCAPE_PPI = 90
-INKSCAPE_PPmm = INKSCAPE_PPI / (1 * ureg.inch).to('mm')
-
-float_pattern = r'[+-]?\d+(\.\d+)?([eE][+-]?\d+)?'  # 2, 1.23, 23e39, 1.23e-6, etc.
-cre_path_command = re.compile(rf'((?P<xy_command>[ML])\s+(?P<x>{float_pattern}),\s*(?P<y>{float_pattern})\s*|'
-                              rf'(?P<x_command>[H])\s+(?P<hx>{float_pattern})\s*|'
-                              rf'(?P<y_command>[V])\s+(?P<vy>{float_pattern})\s*|'
-                              rf'(?P<command>[Z]\s*|'
-                              rf'(?P<curve_command>[CQ])\s+'
-                              rf'((?P<curve_x1>{float_pattern}),\s*(?P<curve_y1>{float_pattern}),\s*'
-                              rf'(?P<curve_x2>{float_pattern}),\s*(?P<curve_y2>{float_pattern}),\s*)?'
-                              rf'(?P<curve_x>{float_pattern}),\s*(?P<curve_y>{float_pattern})\s*))'
-                              rf'|'
-                              rf'(?P<relative_command>[lhv])\s+(?P<relative_values>(?:{float_pattern}\s*,?\s*)+)'
-                              )
-
-
-def shape_path_points(svg_path_d: str) -> List[Dict[str, float]]:
+INKSCAPE_PPmm = INKSCAPE_PPI / 25.4  # 1 inch = 25.4 mm
+
+float_pattern = r'[+-]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?'  # 2, 1.23, 23e39, 1.23e-6, etc.
+cre_float = re.compile(float_pattern)
+
+DEFAULT_SHAPES_XPATH = '//svg:path | //svg:polygon'
+# Each path command letter, followed by its (possibly empty) list of values.
+cre_path_segment = re.compile(r'(?P<command>[MmZzLlHhVvCcSsQqTtAa])(?P<values>[^MmZzLlHhVvCcSsQqTtAa]*)')
+
+# Number of values consumed by each supported path command.  Values beyond the
+# first group are implicit repeats of the same command (e.g., `L 1,2 3,4`).
+PATH_COMMAND_ARITY = {'M': 2, 'L': 2, 'H': 1, 'V': 1, 'Z': 0, 'z': 0, 'l': 2, 'h': 1, 'v': 1}
+
+
+def shape_path_points(svg_path_d: str) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Extracts and returns a list of coordinates of points found in the SVG path.
+    Extracts and returns the coordinates of points found in the SVG path.
 
     Parameters
     ----------
@@ -53,9 +46,8 @@ def shape_path_points(svg_path_d: str) -> List[Dict[str, float]]:
 
     Returns
     -------
-    List[Dict[str, float]]
-        A list of dictionaries, where each dictionary contains the "x" and "y"
-        coordinates of a point.
+    Tuple[numpy.ndarray, numpy.ndarray]
+        The "x" and "y" coordinates of the points, respectively.
 
     Notes
     -----
@@ -69,50 +61,32 @@ def shape_path_points(svg_path_d: str) -> List[Dict[str, float]]:
     - h: Horizontal line to (relative)
     - v: Vertical line to (relative)
 
-    Each point is represented by a dictionary with keys "x" and "y".
+    Each command (including implicit repeats of a command) adds one point.
     """
-
-    # TODO Add support for relative commands, e.g., `l, h, v`.
-
-    def _update_path_state(path_state: Dict[str, float], match: re.Match) -> Dict[str, float]:
-        if match.group('xy_command'):
-            for dim_j in 'xy':
-                path_state[dim_j] = float(match.group(dim_j))
-            if path_state.get('x0') is None:
-                for dim_j in 'xy':
-                    path_state[f'{dim_j}0'] = path_state[dim_j]
-        elif match.group('x_command'):
-            path_state['x'] = float(match.group('hx'))
-        elif match.group('y_command'):
-            path_state['y'] = float(match.group('vy'))
-        elif match.group('command') == 'Z':
-            for dim_j in 'xy':
-                path_state[dim_j] = path_state[f'{dim_j}0']
-        elif match.group('relative_command'):
-            relative_command = match.group('relative_command')
-            relative_values = [float(v) for v in re.findall(float_pattern, match.group('relative_values'))]
-
-            if relative_command == 'l':
-                path_state['x'] += relative_values[0]
-                path_state['y'] += relative_values[1]
-            elif relative_command == 'h':
-                path_state['x'] += relative_values[0]
-            elif relative_command == 'v':
-                path_state['y'] += relative_values[0]
-        elif match.group('curve_command'):
-            curve_command = match.group('curve_command')
-            curve_values = [float(v) for v in re.findall(float_pattern, match.group('curve_values'))]
-
-            if curve_command == 'C':
-                # Handle cubic Bezier curve command
-                pass
-
-            elif curve_command == 'Q':
-                # Handle quadratic Bezier curve command
-                pass
-
+    # Split the `"d"` attribute into `(command, values)` segments.
+    segments = []
+    for match_i in cre_path_segment.finditer(svg_path_d):
+        command = match_i.group('command')
+        if command in 'CQ':
             raise NotImplementedError('Bezier curve commands are not supported')
-        return path_state
+        elif command in PATH_COMMAND_ARITY:
+            # Convert all values of the segment to floats in a single call.
+            segments.append((command, np.array(cre_float.findall(match_i.group('values')), dtype=float)))
+
+    size = sum(len(values) // PATH_COMMAND_ARITY[command] if PATH_COMMAND_ARITY[command] else 1
+               for command, values in segments)
+    if _kernels.NUMBA_AVAILABLE:
+        # Walk through all commands in a single compiled loop.
+        cmd_codes = np.array([_kernels.PATH_COMMAND_CODES[command] for command, _ in segments], dtype=np.int8)
+        offsets = np.zeros(len(segments) + 1, dtype=np.int64)
+        np.cumsum([len(values) for _, values in segments], out=offsets[1:])
+        nums = np.concatenate([values for _, values in segments]) if segments else np.empty(0)
+        out_xy = np.empty((2, size))
+        _kernels.walk_path(cmd_codes, nums, offsets, out_xy)
+        return out_xy[0], out_xy[1]
+
+    x_out = np.empty(size)
+    y_out = np.empty(size)
 
     # Some commands in a SVG path element `"d"` attribute require previous state.
     #
@@ -120,13 +94,70 @@ def shape_path_points(svg_path_d: str) -> List[Dict[str, float]]:
     # ``y`` position is required to resolve the new `(x, y)` position.
     #
     # Iterate through the commands in the `"d"` attribute in order and maintain
-    # the current path position in the `path_state` dictionary.
-    path_state = {'x': None, 'y': None}
-    return [{k: v for k, v in _update_path_state(path_state, match_i).items()
-             if k in 'xy'} for match_i in cre_path_command.finditer(svg_path_d)]
+    # the current path position (and the start position of the path).  All
+    # points of a segment (including implicit repeats) are resolved at once.
+    x = y = x0 = y0 = np.nan
+    i = 0
+    for command, values in segments:
+        arity = PATH_COMMAND_ARITY[command]
+        if not arity:
+            x, y = x0, y0
+            x_out[i], y_out[i] = x, y
+            i += 1
+            continue
+        count = len(values) // arity
+        if not count:
+            continue
+        values = values[:count * arity].reshape(count, arity)
+        if command in 'ML':
+            xs, ys = values[:, 0], values[:, 1]
+            if np.isnan(x0):
+                x0, y0 = xs[0], ys[0]
+        elif command == 'H':
+            xs, ys = values[:, 0], y
+        elif command == 'V':
+            xs, ys = x, values[:, 0]
+        else:
+            # Relative command; accumulate offsets from the current position
+            # (in order, to match sequential addition).
+            xs = np.cumsum(np.append(x, values[:, 0]))[1:] if command in 'lh' else x
+            ys = np.cumsum(np.append(y, values[:, -1]))[1:] if command in 'lv' else y
+        x_out[i:i + count] = xs
+        y_out[i:i + count] = ys
+        i += count
+        x, y = x_out[i - 1], y_out[i - 1]
+    return x_out, y_out
+
+
+def iterparse_elements(svg_source, tags: List[str]):
+    """
+    Iterate through elements with the specified tag(s) in an SVG source,
+    without loading the whole document tree.
+
+    Each element (and any preceding siblings) is cleared once the next element
+    is requested, so elements must be processed as they are yielded.
+
+    Parameters
+    ----------
+    svg_source : str or file-like
+        A file path or file-like object.
+    tags : list[str]
+        Qualified tag names (e.g., ``'{http://www.w3.org/2000/svg}path'``).
+    """
+    if isinstance(svg_source, TextIOBase):
+        # `etree.iterparse` can only read bytes, so parse text streams in full.
+        yield from etree.parse(svg_source).iter(*tags)
+        return
+
+    for _, element in etree.iterparse(svg_source, events=('end',), tag=tags):
+        yield element
+        # Free memory used by processed elements.
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
 
 
-def svg_shapes_to_df(svg_source: str, xpath: str = '//svg:path | //svg:polygon',
+def svg_shapes_to_df(svg_source: str, xpath: str = DEFAULT_SHAPES_XPATH,
                      namespaces: Optional[Dict[str, str]] = None) -> pd.DataFrame:
     """
     Construct a data frame with one row per vertex for all shapes in
@@ -139,7 +170,8 @@ def svg_shapes_to_df(svg_source: str, xpath: str = '//svg:path | //svg:polygon',
     xpath : str, optional
         XPath path expression to select shape nodes.
 
-        By default, all ``svg:path`` and ``svg:polygon`` elements are selected.
+        By default, all ``svg:path`` and ``svg:polygon`` elements are selected
+        (streaming through the document, rather than loading the whole tree).
     namespaces : dict, optional
         Key/value mapping of XML namespaces.
 
@@ -158,52 +190,67 @@ def svg_shapes_to_df(svg_source: str, xpath: str = '//svg:path | //svg:polygon',
     if namespaces is None:
         namespaces = INKSCAPE_NSMAP
 
-    e_root = etree.parse(svg_source)
-    frames = []
-    attribs_set = set()
-
-    # Get list of attributes that are set in any of the shapes (not including
-    # the `svg:path` `"d"` attribute or the `svg:polygon` `"points"`
-    # attribute).
-    #
-    # This, for example, collects attributes such as:
-    #
-    #  - `fill`, `stroke` (as part of `"style"` attribute)
-    #  - `"transform"`: matrix, scale, etc.
-    for shape_i in e_root.xpath(xpath, namespaces=namespaces):
-        attribs_set.update(list(shape_i.attrib.keys()))
+    if xpath == DEFAULT_SHAPES_XPATH:
+        shapes = iterparse_elements(svg_source, [f'{{{XHTML_NAMESPACE}}}path', f'{{{XHTML_NAMESPACE}}}polygon'])
+    else:
+        shapes = etree.parse(svg_source).xpath(xpath, namespaces=namespaces)
 
-    attribs_set.discard('d')
-    attribs_set.discard('points')
-    attribs = sorted(attribs_set)
-    # Always add 'id' attribute as first attribute.
-    attribs.insert(0, 'id')
+    # Per-shape attributes and vertex coordinate arrays.
+    shapes_attribs = []
+    shapes_x = []
+    shapes_y = []
+    attribs_set = set()
 
-    for shape_i in e_root.xpath(xpath, namespaces=namespaces):
-        # Gather shape attributes from SVG element.
-        base_fields = [shape_i.attrib.get(k, None) for k in attribs]
+    for shape_i in shapes:
+        # Get list of attributes that are set in any of the shapes.
+        #
+        # This, for example, collects attributes such as:
+        #
+        #  - `fill`, `stroke` (as part of `"style"` attribute)
+        #  - `"transform"`: matrix, scale, etc.
+        attribs_set.update(shape_i.attrib.keys())
 
         if shape_i.tag == f'{{{XHTML_NAMESPACE}}}path':
             # Decode `svg:path` vertices from [`"d"`][1] attribute.
             #
             # [1]: https://developer.mozilla.org/en-US/docs/Web/SVG/Attribute/d
-            points_i = [base_fields + [i] + [point_i.get(k) for k in 'xy']
-                        for i, point_i in enumerate(shape_path_points(shape_i.attrib['d']))]
+            x_i, y_i = shape_path_points(shape_i.attrib['d'])
         elif shape_i.tag == f'{{{XHTML_NAMESPACE}}}polygon':
             # Decode `svg:polygon` vertices from [`"points"`][2] attribute.
             #
             # [2]: https://developer.mozilla.org/en-US/docs/Web/SVG/Attribute/points
-            points_i = [base_fields + [i] + list(map(float, v.split(',')))
-                        for i, v in enumerate(shape_i.attrib['points'].strip().split(' '))]
+            x_i, y_i = np.array(shape_i.attrib['points'].replace(',', ' ').split(), dtype=float).reshape(-1, 2).T
         else:
             warnings.warn(f'Unsupported shape tag type: {shape_i.tag}')
             continue
-        frames.extend(points_i)
-    if not frames:
-        # There were no shapes found, so set `frames` list to `None` to allow
-        # an empty data frame to be created.
-        frames = None
-    return pd.DataFrame(frames, columns=attribs + ['vertex_i', 'x', 'y'])
+        shapes_attribs.append(dict(shape_i.attrib))
+        shapes_x.append(x_i)
+        shapes_y.append(y_i)
+
+    # Do not include the `svg:path` `"d"` attribute or the `svg:polygon`
+    # `"points"` attribute.
+    attribs_set.discard('d')
+    attribs_set.discard('points')
+    attribs_set.discard('id')
+    attribs = sorted(attribs_set)
+    # Always add 'id' attribute as first attribute.
+    attribs.insert(0, 'id')
+
+    if not shapes_attribs:
+        # There were no shapes found, so create an empty data frame.
+        return pd.DataFrame(None, columns=attribs + ['vertex_i', 'x', 'y'])
+
+    # Build the frame column-wise, repeating each attribute value of a shape
+    # once per vertex of the shape.
+    vertex_counts = np.array([x_i.shape[0] for x_i in shapes_x])
+    columns = {k: np.repeat(np.array([attribs_i.get(k) for attribs_i in shapes_attribs], dtype=object),
+                            vertex_counts)
+               for k in attribs}
+    columns['vertex_i'] = (np.arange(vertex_counts.sum()) -
+                           np.repeat(np.cumsum(vertex_counts) - vertex_counts, vertex_counts))
+    columns['x'] = np.concatenate(shapes_x)
+    columns['y'] = np.concatenate(shapes_y)
+    return pd.DataFrame(columns)
 
 
 def compute_shape_centers(df_shapes: pd.DataFrame, shape_i_column: str, inplace: bool = False) -> pd.DataFrame:
@@ -239,26 +286,32 @@ def compute_shape_centers(df_shapes: pd.DataFrame, shape_i_column: str, inplace:
          - ``x_center_offset``/``y_center_offset``:
              * Coordinates of each vertex coordinate relative to shape center.
     """
-    if not isinstance(shape_i_column, bytes):
-        raise KeyError('Shape index must be a single column.')
+    if isinstance(shape_i_column, (list, tuple)):
+        if len(shape_i_column) != 1:
+            raise KeyError('Shape index must be a single column.')
+        shape_i_column = shape_i_column[0]
 
     if not inplace:
         df_shapes = df_shapes.copy()
 
-    # Get coordinates of the center of each path.
-    df_bounding_boxes = get_bounding_boxes(df_shapes, shape_i_column)
-    path_centers = (df_bounding_boxes[['x', 'y']] + .5 *
-                    df_bounding_boxes[['width', 'height']].values)
-    df_shapes['x_center'] = path_centers.x[df_shapes[shape_i_column]].values
-    df_shapes['y_center'] = path_centers.y[df_shapes[shape_i_column]].values
+    # Get coordinates of the center of each path, broadcast to each vertex of
+    # the respective path.
+    xy_groups = df_shapes.groupby(shape_i_column, sort=False)[['x', 'y']]
+    xy_min = xy_groups.transform('min').values
+    xy_max = xy_groups.transform('max').values
+    path_centers = xy_min + .5 * (xy_max - xy_min)
+    df_shapes['x_center'] = path_centers[:, 0]
+    df_shapes['y_center'] = path_centers[:, 1]
 
     # Calculate the coordinates of each path vertex relative to center point of
     # path.
-    center_offset = df_shapes[['x', 'y']] - df_shapes[['x_center', 'y_center']].values
-    return df_shapes.join(center_offset, rsuffix='_center_offset')
+    center_offset = df_shapes[['x', 'y']].values - path_centers
+    df_shapes['x_center_offset'] = center_offset[:, 0]
+    df_shapes['y_center_offset'] = center_offset[:, 1]
+    return df_shapes
 
 
-def scale_points(df_points: pd.DataFrame, scale: float = INKSCAPE_PPmm.magnitude,
+def scale_points(df_points: pd.DataFrame, scale: float = INKSCAPE_PPmm,
                  inplace: bool = False) -> pd.DataFrame:
     """
     Translate points such that bounding box is anchored at (0, 0) and scale
@@ -294,14 +347,19 @@ def scale_points(df_points: pd.DataFrame, scale: float = INKSCAPE_PPmm.magnitude
     """
     if not inplace:
         df_points = df_points.copy()
-
-    # Offset device, such that all coordinates are >= 0.
-    df_points.x -= df_points.x.min()
-    df_points.y -= df_points.y.min()
-
+    if len(df_points) == 0:
+        return df_points
+
+    points = df_points[['x', 'y']].to_numpy(dtype=float, copy=True)
+    # Offset device, such that all coordinates are >= 0 (skipping missing
+    # coordinates, like `pandas.Series.min`).
+    with warnings.catch_warnings():
+        # Ignore warning for a column of only missing coordinates.
+        warnings.simplefilter('ignore', RuntimeWarning)
+        points -= np.nanmin(points, axis=0)
     # Scale path coordinates.
-    df_points.x /= scale
-    df_points.y /= scale
+    points /= scale
+    df_points[['x', 'y']] = points
 
     return df_points
 
@@ -322,17 +380,8 @@ def scale_to_fit_a_in_b(a_shape: pd.Series, b_shape: pd.Series) -> float:
         Scale factor to fit :data:`a_shape` into :data:`b_shape` while
         maintaining aspect ratio.
     """
-    # Normalize the shapes to allow comparison.
-    a_shape_normal = a_shape / a_shape.max()
-    b_shape_normal = b_shape / b_shape.max()
-
-    if a_shape_normal.width > b_shape_normal.width:
-        a_shape_normal *= b_shape_normal.width / a_shape_normal.width
-
-    if a_shape_normal.height > b_shape_normal.height:
-        a_shape_normal *= b_shape_normal.height / a_shape_normal.height
-
-    return a_shape_normal.max() * b_shape.max() / a_shape.max()
+    # The limiting dimension determines the scale factor.
+    return min(b_shape.width / a_shape.width, b_shape.height / a_shape.height)
 
 
 def fit_points_in_bounding_box(df_points: pd.DataFrame, bounding_box: pd.Series,
@@ -438,8 +487,6 @@ def remove_layer(svg_source: str, layer_name: Union[str, List[str]]) -> StringIO
             for g in layer_groups:
                 g.getparent().remove(g)
 
-    # Write result to `StringIO`.
-    output = StringIO()
-    xml_root.write(output)
-    output.seek(0)
-    return output
+    # Serialize result directly to text (`ElementTree.write()` only emits
+    # bytes, which cannot be written to `StringIO`).
+    return StringIO(etree.tostring(xml_root, encoding='unicode'))
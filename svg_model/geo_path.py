@@ -14,18 +14,62 @@ Redistribution and use in source and binary forms, with or without modification,
 
 THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
-from itertools import chain
+from itertools import accumulate
 
+import numpy as np
+
+from . import _kernels
 from .loop import Loop
 
+# Minimum number of loops in a path for loop properties to be computed in
+# parallel (using a compiled kernel).
+PARALLEL_LOOP_COUNT = 64
+
 
 class Path:
     """
     A Path is a list of loops.
+
+    The vertices of all loops are stored in a single buffer, so loop vertices
+    should be modified in place (or through :meth:`offset`) rather than
+    reassigned.
     """
 
     def __init__(self, loops: list[Loop]):
         self.loops = [loop if isinstance(loop, Loop) else Loop(loop) for loop in loops]
+        # Start index of the vertices of each loop, followed by the total number
+        # of vertices.
+        self._loop_offsets = list(accumulate((loop._xy.shape[1] for loop in self.loops), initial=0))
+        # Vertices of all loops in a single contiguous `(2, N)` buffer (see
+        # `Loop.verts`), where the vertices of each loop are a view into the
+        # buffer.
+        if len(self.loops) == 1:
+            # The vertices of a single loop already form the buffer.
+            self._xy = self.loops[0]._xy
+        else:
+            self._bind_verts(np.concatenate([loop._xy for loop in self.loops], axis=1) if self.loops
+                             else np.empty((2, 0), dtype=Loop.dtype))
+        # Bounding box of all loops, computed on first request.
+        self._bounding_box = None
+        # Number of times the path has been offset (see `Svg`).
+        self._revision = 0
+
+    def _bind_verts(self, xy: np.ndarray) -> None:
+        """
+        Store the vertices of all loops in the given `(2, N)` buffer (which
+        must contain the current vertices), and rebind the vertices of each
+        loop to a view into the buffer.
+        """
+        self._xy = xy
+        for loop, start, stop in zip(self.loops, self._loop_offsets[:-1], self._loop_offsets[1:]):
+            # Rebind vertices directly, since cached loop properties still apply.
+            loop._xy = xy[:, start:stop]
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        # Loop vertices are unpickled as separate arrays, so rebind them as
+        # views into the buffer.
+        self._bind_verts(self._xy)
 
     def get_area(self) -> float:
         return sum(loop.get_area() for loop in self.loops)
@@ -37,38 +81,84 @@ class Path:
         x, y, width, height = self.get_bounding_box()
         return x + width / 2.0, y + height / 2.0
 
-    def get_centroid(self) -> tuple[float, float]:
-        x, y = 0.0, 0.0
+    def _fill_loop_caches(self, key: str) -> None:
+        """
+        Compute the area, centroid and moment of all loops in parallel, if
+        there are enough loops to benefit and the specified loop property
+        (e.g., ``'centroid'``) is not already cached for every loop.
+        """
+        if not (_kernels.NUMBA_AVAILABLE and len(self.loops) >= PARALLEL_LOOP_COUNT):
+            return
+        if all(key in loop._cache for loop in self.loops):
+            return
+        sums = _kernels.shoelace_loops(*self._xy, np.array(self._loop_offsets, dtype=np.int64))
+        for loop, (double_area, x_sum, y_sum, moment_sum) in zip(self.loops, sums.tolist()):
+            loop._cache.setdefault('signed_area', double_area / 2)
+            loop._cache.setdefault('moment', moment_sum / 12)
+            if double_area:
+                loop._cache.setdefault('centroid', (x_sum / (3 * abs(double_area)),
+                                                    y_sum / (3 * abs(double_area))))
 
-        for loop in self.loops:
-            loop_x, loop_y = loop.get_centroid()
-            x += loop_x * loop.get_mass()
-            y += loop_y * loop.get_mass()
-
-        area = self.get_area()
-        if area > 0:
-            x /= area
-            y /= area
+    def get_centroid(self) -> tuple[float, float]:
+        if not self.loops:
+            return 0.0, 0.0
+        if len(self.loops) == 1:
+            return self.loops[0].get_centroid()
+
+        # Mass-weighted mean of loop centroids.
+        if len(self.loops) < PARALLEL_LOOP_COUNT:
+            x = y = total_mass = 0.0
+            for loop in self.loops:
+                loop_x, loop_y = loop.get_centroid()
+                mass = loop.get_mass()
+                x += loop_x * mass
+                y += loop_y * mass
+                total_mass += mass
+        else:
+            self._fill_loop_caches('centroid')
+            centroids = np.array([loop.get_centroid() for loop in self.loops])
+            masses = np.array([loop.get_mass() for loop in self.loops])
+            x, y = np.dot(masses, centroids).tolist()
+            total_mass = float(masses.sum())
+
+        if total_mass > 0:
+            x /= total_mass
+            y /= total_mass
         return x, y
 
     def get_moment(self) -> float:
+        self._fill_loop_caches('moment')
         return sum(loop.get_moment() for loop in self.loops)
 
     def offset(self, x: float, y: float):
+        # Translate the vertices of all loops at once.
+        self._xy[0] += x
+        self._xy[1] += y
+        self._offset_cache(x, y)
+        self._revision += 1
+
+    def _offset_cache(self, x: float, y: float) -> None:
+        """
+        Update cached properties after the vertices are offset by the given x
+        and y values.
+        """
         for loop in self.loops:
-            loop.offset(x, y)
+            loop._offset_cache(x, y)
+        if self._bounding_box is not None:
+            # Translate cached bounding box along with the vertices.
+            min_x, min_y, width, height = self._bounding_box
+            self._bounding_box = min_x + x, min_y + y, width, height
 
     def offset_to_origin(self) -> None:
         x, y = self.get_centroid()
-        for loop in self.loops:
-            loop.offset(-x, -y)
+        self.offset(-x, -y)
 
     def get_bounding_box(self) -> tuple[float, float, float, float]:
-        x_vals = list(chain(*[list(zip(*loop.verts))[0] for loop in self.loops]))
-        y_vals = list(chain(*[list(zip(*loop.verts))[1] for loop in self.loops]))
-        min_x, min_y = min(x_vals), min(y_vals)
-        max_x, max_y = max(x_vals), max(y_vals)
-        return min_x, min_y, max_x - min_x, max_y - min_y
+        if self._bounding_box is None:
+            min_x, min_y = self._xy.min(axis=1).tolist()
+            max_x, max_y = self._xy.max(axis=1).tolist()
+            self._bounding_box = min_x, min_y, max_x - min_x, max_y - min_y
+        return self._bounding_box
 
 
 class ColoredPath(Path):
@@ -77,7 +167,9 @@ class ColoredPath(Path):
         super().__init__(loops)
         self.color = (0, 0, 0)
 
-    def _serialize_verts(self, triangles):
-        for vert in triangles:
-            yield vert[0]
-            yield vert[1]
+    def _serialize_verts(self, triangles) -> np.ndarray:
+        """
+        Return the interleaved `x, y` coordinates of the triangle vertices as
+        a contiguous `float32` buffer (e.g., for upload to a vertex buffer).
+        """
+        return np.asarray(triangles, dtype=np.float32).ravel()
@@ -17,8 +17,8 @@ import sys
 import pymunk
 
 from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPainter, QColor, QPainterPath
+from PyQt5.QtCore import Qt, QPointF
+from PyQt5.QtGui import QPainter, QColor, QPainterPath, QPolygonF
 
 from svg_model.path_group import PathGroup
 from svg_model.body_group import BodyGroup
@@ -32,11 +32,18 @@ class CustomWidget(QWidget):
         self.body_group = body_group_
         self.setMinimumSize(640, 480)
         self.clicked_coords = None
+        x, y, width, height = self.path_group.get_bounding_box()
+        # Shapes are drawn centered on the origin of the widget.
+        self._half_width, self._half_height = width / 2., height / 2.
+        self._shape_filter = pymunk.ShapeFilter()
+        # Painter paths for the loops of each path, built once rather than
+        # on every paint event.
+        self._painter_paths = {id(p): [self.make_painter_path(loop) for loop in p.loops]
+                               for p in self.body_group.paths.values()}
 
     def mousePressEvent(self, event):
-        x, y, width, height = self.path_group.get_bounding_box()
-        coords = self.translate([(event.x(), event.y())], -width / 2., -height / 2.0)[0]
-        shape = self.body_group.space.point_query_nearest(coords, max_distance=0, shape_filter=pymunk.ShapeFilter())
+        coords = (event.x() - self._half_width, event.y() - self._half_height)
+        shape = self.body_group.space.point_query_nearest(coords, max_distance=0, shape_filter=self._shape_filter)
 
         if shape:
             print(self.body_group.get_name(shape.shape.body))
@@ -45,23 +52,21 @@ class CustomWidget(QWidget):
         painter = QPainter(self)
         self.draw_paths(painter)
 
-    def translate(self, coords, x, y):
-        return [(c[0] + x, c[1] + y) for c in coords]
+    @staticmethod
+    def make_painter_path(loop):
+        path = QPainterPath()
+        path.addPolygon(QPolygonF([QPointF(x, y) for x, y in loop.verts.tolist()]))
+        path.closeSubpath()
+        return path
 
     def draw_path(self, painter, p):
         color = QColor(*p.color) if p.color else QColor(Qt.black)
         painter.setBrush(color)
-        for loop in p.loops:
-            path = QPainterPath()
-            path.moveTo(*loop.verts[0])
-            for v in loop.verts[1:]:
-                path.lineTo(*v)
-            path.closeSubpath()
+        for path in self._painter_paths[id(p)]:
             painter.drawPath(path)
 
     def draw_paths(self, painter):
-        x, y, width, height = self.path_group.get_bounding_box()
-        painter.translate(width / 2., height / 2.)
+        painter.translate(self._half_width, self._half_height)
         for p in self.body_group.paths.values():
             self.draw_path(painter, p)
 
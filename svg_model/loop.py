@@ -24,16 +24,127 @@ WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWIS
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."""
 from typing import Optional
 
+import numpy as np
+
+from . import _kernels
+
+# Minimum number of vertices for the orientation of a loop to be computed (on
+# construction) using NumPy, rather than by accumulating the loop properties in
+# Python, if the compiled kernel is not available.
+VECTORIZED_LOOP_SIZE = 24
+
+
+def _edge_sums(x: float, y: float, x_next: float, y_next: float) -> tuple[float, float, float, float]:
+    """
+    Return the (shoelace) area, centroid and moment terms of a single edge.
+    """
+    factor = x_next * y - x * y_next
+    return (factor, (x + x_next) * factor, (y + y_next) * factor,
+            factor * (x * x + x_next * x + x * x_next + x_next * x_next
+                      + y * y + y_next * y + y * y_next + y_next * y_next))
+
+
+def _triangle_sums(verts: list) -> tuple[float, float, float, float]:
+    (x0, y0), (x1, y1), (x2, y2) = verts
+    return tuple(a + b + c for a, b, c in zip(_edge_sums(x0, y0, x1, y1), _edge_sums(x1, y1, x2, y2),
+                                              _edge_sums(x2, y2, x0, y0)))
+
+
+def _quad_sums(verts: list) -> tuple[float, float, float, float]:
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = verts
+    return tuple(a + b + c + d for a, b, c, d in zip(_edge_sums(x0, y0, x1, y1), _edge_sums(x1, y1, x2, y2),
+                                                     _edge_sums(x2, y2, x3, y3), _edge_sums(x3, y3, x0, y0)))
+
+
+def _loop_sums(verts: list) -> tuple[float, float, float, float]:
+    # Accumulate the terms of each edge (see `_edge_sums`), starting with the
+    # closing edge.
+    double_area = x_sum = y_sum = moment_sum = 0.0
+    if verts:
+        x, y = verts[-1]
+        for x_next, y_next in verts:
+            factor = x_next * y - x * y_next
+            double_area += factor
+            x_sum += (x + x_next) * factor
+            y_sum += (y + y_next) * factor
+            moment_sum += factor * (x * x + x_next * x + x * x_next + x_next * x_next
+                                    + y * y + y_next * y + y * y_next + y_next * y_next)
+            x, y = x_next, y_next
+    return double_area, x_sum, y_sum, moment_sum
+
+
+# Closed-form (shoelace) sums for loops with a small, fixed number of vertices.
+SMALL_LOOP_SUMS = {3: _triangle_sums, 4: _quad_sums}
+
 
 class Loop:
     density = 1
+    # Storage type of vertex coordinates.  Reductions (e.g., area, centroid)
+    # are always accumulated in double precision.
+    dtype = np.float32
 
     def __init__(self, verts: Optional[list] = None):
         if verts is None:
             verts = []
         self.verts = verts
-        if not self.is_clockwise():
-            self.verts.reverse()
+        vertex_count = self._xy.shape[1]
+        if vertex_count in SMALL_LOOP_SUMS:
+            self._init_cache(SMALL_LOOP_SUMS[vertex_count](self.verts.tolist()))
+        elif _kernels.NUMBA_AVAILABLE:
+            self._init_cache(_kernels.shoelace(*self._xy))
+        elif vertex_count < VECTORIZED_LOOP_SIZE:
+            # Per-call NumPy overhead outweighs vectorizing small loops.
+            self._init_cache(_loop_sums(self.verts.tolist()))
+        elif not self.is_clockwise():
+            self.verts = self.verts[::-1]
+
+    def _init_cache(self, sums: tuple[float, float, float, float]) -> None:
+        """
+        Orient vertices clockwise and fill the cache of computed properties
+        from the (shoelace) sums of the vertices.
+
+        See :func:`svg_model._kernels.shoelace` for a description of the
+        sums.
+        """
+        double_area, x_sum, y_sum, moment_sum = sums
+        if not double_area > 0:
+            # Reversing the vertices negates each cross product (reverse the
+            # storage directly, since the cache is filled below).
+            self._xy = np.ascontiguousarray(self._xy[:, ::-1])
+            double_area, x_sum, y_sum, moment_sum = -double_area, -x_sum, -y_sum, -moment_sum
+        self._cache['signed_area'] = double_area / 2
+        self._cache['moment'] = moment_sum / 12
+        if double_area:
+            self._cache['centroid'] = x_sum / (3 * double_area), y_sum / (3 * double_area)
+
+    @property
+    def verts(self) -> np.ndarray:
+        """
+        Vertices as a `(N, 2)` array of `(x, y)` coordinates.
+
+        The array is a view of the vertex storage, which is a contiguous
+        `(2, N)` array (i.e., one row of ``x`` and one row of ``y``
+        coordinates).
+        """
+        return self._xy.T
+
+    @verts.setter
+    def verts(self, verts) -> None:
+        self._xy = np.ascontiguousarray(np.asarray(verts, dtype=self.dtype).reshape(-1, 2).T)
+        # Computed properties (e.g., area, centroid) of the current vertices.
+        #
+        # Note: modifying the vertex array in place does not reset the cache.
+        self._cache = {}
+
+    def _get_edges(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the ``x``/``y`` coordinates of the start and end vertex of each
+        edge, along with the (shoelace) cross product of each edge.
+        """
+        xy = self._xy.astype(np.float64, copy=False)
+        x, y = xy
+        x_next, y_next = np.concatenate([xy[:, 1:], xy[:, :1]], axis=1)
+        return x, y, x_next, y_next, x_next * y - x * y_next
 
     def get_signed_area(self) -> float:
         """
@@ -41,11 +152,10 @@ class Loop:
         If verts wind anti-clockwise, this returns a negative number.
         Assume y-axis points up.
         """
-        accum = 0.0
-        for i in range(len(self.verts)):
-            j = (i + 1) % len(self.verts)
-            accum += (self.verts[j][0] * self.verts[i][1] - self.verts[i][0] * self.verts[j][1])
-        return accum / 2
+        if 'signed_area' not in self._cache:
+            factor = self._get_edges()[-1]
+            self._cache['signed_area'] = float(factor.sum()) / 2
+        return self._cache['signed_area']
 
     def get_area(self) -> float:
         """
@@ -71,18 +181,16 @@ class Loop:
         """
         Calculate and return the centroid of the loop.
         """
-        x, y = 0.0, 0.0
-
-        for i in range(len(self.verts)):
-            j = (i + 1) % len(self.verts)
-            factor = self.verts[j][0] * self.verts[i][1] - self.verts[i][0] * self.verts[j][1]
-            x += (self.verts[i][0] + self.verts[j][0]) * factor
-            y += (self.verts[i][1] + self.verts[j][1]) * factor
+        if 'centroid' not in self._cache:
+            x, y, x_next, y_next, factor = self._get_edges()
+            # Reuse the cross products of the centroid pass for the area.
+            self._cache.setdefault('signed_area', float(factor.sum()) / 2)
 
-        polyarea = self.get_area()
-        x /= 6 * polyarea
-        y /= 6 * polyarea
-        return x, y
+            x = float(np.dot(x + x_next, factor))
+            y = float(np.dot(y + y_next, factor))
+            polyarea = self.get_area()
+            self._cache['centroid'] = x / (6 * polyarea), y / (6 * polyarea)
+        return self._cache['centroid']
 
     def offset(self, x: float, y: float) -> None:
         """
@@ -91,20 +199,29 @@ class Loop:
         :param x: X offset value.
         :param y: Y offset value.
         """
-        self.verts = [(vert[0] + x, vert[1] + y) for vert in self.verts]
+        self._xy[0] += x
+        self._xy[1] += y
+        self._offset_cache(x, y)
+
+    def _offset_cache(self, x: float, y: float) -> None:
+        """
+        Update cached properties after the vertices are offset by the given x
+        and y values.
+        """
+        # Area is unchanged by translation, and the centroid moves with the
+        # vertices (the moment must be recomputed).
+        self._cache.pop('moment', None)
+        if 'centroid' in self._cache:
+            centroid_x, centroid_y = self._cache['centroid']
+            self._cache['centroid'] = centroid_x + x, centroid_y + y
 
     def get_moment(self) -> float:
         """
         Calculate and return the moment of the loop.
         """
-        moment = 0.0
-
-        for i in range(len(self.verts)):
-            j = (i + 1) % len(self.verts)
-            factor = (self.verts[j][0] * self.verts[i][1] - self.verts[i][0] * self.verts[j][1])
-            moment += factor * (self.verts[i][0] * self.verts[i][0] + self.verts[j][0] * self.verts[i][0]
-                                + self.verts[i][0] * self.verts[j][0] + self.verts[j][0] * self.verts[j][0]
-                                + self.verts[i][1] * self.verts[i][1] + self.verts[j][1] * self.verts[i][1]
-                                + self.verts[i][1] * self.verts[j][1] + self.verts[j][1] * self.verts[j][1])
-
-        return moment / 12
\ No newline at end of file
+        if 'moment' not in self._cache:
+            x, y, x_next, y_next, factor = self._get_edges()
+            moment = float(np.dot(factor, x * x + x_next * x + x * x_next + x_next * x_next
+                                  + y * y + y_next * y + y * y_next + y_next * y_next))
+            self._cache['moment'] = moment / 12
+        return self._cache['moment']
\ No newline at end of file
@@ -1,5 +1,4 @@
 # coding: utf-8
-import re
 from typing import Tuple, List
 
 import svgwrite
@@ -9,15 +8,15 @@ from io import StringIO
 
 from . import INKSCAPE_NSMAP, INKSCAPE_PPmm
 
-CRE_MM_LENGTH = re.compile(r'^(?P<length>\d+(\.\d+))mm$')
+# Query for Inkscape layers, compiled once for all documents.
+find_svg_layers = etree.XPath('//svg:g[@inkscape:groupmode="layer"]', namespaces=INKSCAPE_NSMAP)
 
 
 def extract_length(attr: str) -> float:
     """Extract length in pixels."""
-    match = CRE_MM_LENGTH.match(attr)
-    if match:
+    if attr.endswith('mm'):
         # Length is specified in millimeters.
-        return INKSCAPE_PPmm.magnitude * float(match.group('length'))
+        return INKSCAPE_PPmm * float(attr[:-2])
     else:
         return float(attr)
 
@@ -38,15 +37,14 @@ def get_svg_layers(svg_sources: List[StringIO]) -> [Tuple[int, int], List[etree.
         module), one per SVG layer.
     """
     layers = []
-    width, height = None, None
+    width, height = 0.0, 0.0
 
     for svg_source_i in svg_sources:
         # Parse input file.
-        xml_root = etree.parse(svg_source_i)
-        svg_root = xml_root.xpath('/svg:svg', namespaces=INKSCAPE_NSMAP)[0]
+        svg_root = etree.parse(svg_source_i).getroot()
         width = max(extract_length(svg_root.attrib['width']), width)
         height = max(extract_length(svg_root.attrib['height']), height)
-        layers += svg_root.xpath('//svg:g[@inkscape:groupmode="layer"]', namespaces=INKSCAPE_NSMAP)
+        layers += find_svg_layers(svg_root)
 
     for i, layer_i in enumerate(layers):
         layer_i.attrib['id'] = f'layer{i + 1}'
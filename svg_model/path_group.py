@@ -34,16 +34,11 @@ class PathGroup:
         :return: A PathGroup instance representing the paths in the SVG.
         """
         # Parse SVG file.
-        parser = SvgParser()
-        svg = parser.parse_file(svg_path, on_error)
-        paths = svg.paths
+        svg = SvgParser().parse_file(svg_path, on_error)
 
-        if not paths:
+        if not svg.paths:
             raise Exception("File has no valid paths.")
-        boundary = svg.get_boundary()
-        del svg
-        del parser
-        return cls(paths, boundary)
+        return cls(svg.paths, svg.get_boundary())
 
     def get_bounding_box(self):
         """
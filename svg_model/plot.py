@@ -1,6 +1,7 @@
 # coding: utf-8
 import itertools
 
+import numpy as np
 import pandas as pd
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -32,18 +33,28 @@ def plot_shapes(df_shapes: pd.DataFrame, shape_i_columns: list, axis=None, autox
     props = itertools.cycle(mpl.rcParams['axes.prop_cycle'])
     color = kwargs.pop('fc', None)
 
-    patches = [Polygon(df_shape_i[['x', 'y']].values, fc=next(props)['color'] if color is None else color, **kwargs)
-               for shape_i, df_shape_i in df_shapes.groupby(shape_i_columns)]
+    # Split the vertices into one contiguous block per shape (ordered as with
+    # `groupby`) and build one polygon per block.
+    shape_codes = df_shapes.groupby(shape_i_columns).ngroup().to_numpy()
+    order = np.argsort(shape_codes, kind='stable')
+    order = order[shape_codes[order] >= 0]
+    shape_breaks = np.flatnonzero(np.diff(shape_codes[order])) + 1
+    xy = df_shapes[['x', 'y']].to_numpy(dtype=float)
+    shapes_xy = np.split(xy[order], shape_breaks) if order.size else []
+
+    patches = [Polygon(xy_i, fc=next(props)['color'] if color is None else color, **kwargs)
+               for xy_i in shapes_xy]
 
     collection = PatchCollection(patches)
 
     axis.add_collection(collection)
 
-    xy_stats = df_shapes[['x', 'y']].describe()
-    if autoxlim:
-        axis.set_xlim(*xy_stats.x.loc[['min', 'max']])
-    if autoylim:
-        axis.set_ylim(*xy_stats.y.loc[['min', 'max']])
+    if autoxlim or autoylim:
+        xy_min, xy_max = np.nanmin(xy, axis=0), np.nanmax(xy, axis=0)
+        if autoxlim:
+            axis.set_xlim(xy_min[0], xy_max[0])
+        if autoylim:
+            axis.set_ylim(xy_min[1], xy_max[1])
     return axis
 
 
@@ -65,10 +76,9 @@ def plot_shapes_heat_map(df_shapes: pd.DataFrame, shape_i_columns: list, values:
     Returns:
         tuple: Heat map axis and colorbar axis.
     """
-    df_shapes = df_shapes.copy()
-    df_shapes['y'] = df_shapes.y.max() - df_shapes.y.values
-
-    aspect_ratio = (df_shapes.x.max() - df_shapes.x.min()) / (df_shapes.y.max() - df_shapes.y.min())
+    x_min, x_max = df_shapes.x.min(), df_shapes.x.max()
+    y_min, y_max = df_shapes.y.min(), df_shapes.y.max()
+    aspect_ratio = (x_max - x_min) / (y_max - y_min)
 
     if vmin is not None or vmax is not None:
         norm = mpl.colors.Normalize(vmin=vmin or values.min(), vmax=vmax or values.max())
@@ -101,8 +111,10 @@ def plot_shapes_heat_map(df_shapes: pd.DataFrame, shape_i_columns: list, values:
         tick_labels[-1] = f'$\geq$ {tick_labels[-1].get_text()}'
     colorbar.ax.set_yticklabels(tick_labels)
 
-    axis.set_xlim(df_shapes.x.min(), df_shapes.x.max())
-    axis.set_ylim(df_shapes.y.min(), df_shapes.y.max())
+    axis.set_xlim(x_min, x_max)
+    # Flip the y-axis (rather than the shape coordinates), such that shapes
+    # are drawn with the SVG orientation (i.e., y-axis pointing down).
+    axis.set_ylim(y_max, y_min)
     return axis, colorbar
 
 
@@ -1,4 +1,5 @@
 # coding: utf-8
+import numpy as np
 import pandas as pd
 import pymunk as pm
 
@@ -22,11 +23,14 @@ def get_shapes_pymunk_space(df_convex_shapes: pd.DataFrame,
         shape_i_columns = [shape_i_columns]
 
     space = pm.Space()
-    bodies = []
 
     convex_groups = df_convex_shapes.groupby(shape_i_columns)
+    xy = df_convex_shapes[['x', 'y']].to_numpy()
+    # Body of each convex shape, and the corresponding shape index.
+    bodies = np.empty(convex_groups.ngroups, dtype=object)
+    shape_indexes = np.empty(convex_groups.ngroups, dtype=object)
 
-    for shape_i, df_i in convex_groups:
+    for i, (shape_i, index_i) in enumerate(convex_groups.indices.items()):
         if not isinstance(shape_i, (list, tuple)):
             shape_i = [shape_i]
 
@@ -39,11 +43,10 @@ def get_shapes_pymunk_space(df_convex_shapes: pd.DataFrame,
 
         space.add(body)  # Add the body to the space before adding shapes
 
-        # Using a list comprehension is more efficient than df_i[['x', 'y']].values.
-        points = [[x, y] for x, y in zip(df_i.x, df_i.y)]
-        poly = pm.Poly(body, points)
+        poly = pm.Poly(body, xy[index_i].tolist())
         space.add(poly)
-        bodies.append([body, shape_i[0]])
+        bodies[i] = body
+        shape_indexes[i] = shape_i[0]
 
-    bodies = None if not bodies else bodies
-    return space, pd.DataFrame(bodies, columns=['body', shape_i_columns[0]]).set_index('body')[shape_i_columns[0]]
+    return space, pd.Series(shape_indexes, index=pd.Index(bodies, name='body'),
+                            name=shape_i_columns[0]).infer_objects()
@@ -37,7 +37,8 @@ class ShapesCanvas:
 
     The `ShapesCanvas.find_shape` method returns the shape located at the
     specified *canvas* coordinates (or `None`, if no shape intersects with
-    specified point).
+    specified point).  The `ShapesCanvas.find_shapes` method does the same for
+    arrays of canvas coordinates.
     """
 
     def __init__(self, df_shapes: pd.DataFrame, shape_i_columns: Union[str, List[str]],
@@ -77,6 +78,13 @@ class ShapesCanvas:
         # `canvas_bodies`.
         self.space, self.bodies = get_shapes_pymunk_space(self.df_tesselations,
                                                           shape_i_columns + ['triangle_i'])
+        # Vertices of each triangle (one row of three `(x, y)` vertices per
+        # triangle), and the corresponding shape identifier, for batched point
+        # queries (see `find_shapes`).
+        self.triangles = self.df_tesselations[['x', 'y']].values.reshape(-1, 3, 2)
+        self.triangle_shapes = self.df_tesselations[shape_i_columns[0]].values[::3]
+        # Grid index of the triangles (see `_get_triangle_index`).
+        self._triangle_index = None
         self.padding_fraction = padding_fraction
         self.reset_shape(canvas_shape, self.padding_fraction)
 
@@ -130,3 +138,102 @@ class ShapesCanvas:
         if shape:
             return self.bodies[shape.body]
         return None
+
+    def _get_triangle_index(self) -> tuple:
+        """
+        Return a uniform grid index of the tesselated triangles, built on
+        first request.
+
+        Returns
+        -------
+        tuple
+            Grid origin, cell size, number of cells along ``x`` and ``y``,
+            the index of each triangle overlapping each cell (ordered by cell,
+            then by triangle), and the start of the triangles of each cell
+            (followed by the total number of entries).
+        """
+        if self._triangle_index is None:
+            lower = self.triangles.min(axis=1)
+            upper = self.triangles.max(axis=1)
+            origin = lower.min(axis=0)
+            extent = upper.max(axis=0) - origin
+            # Size cells to fit a typical triangle, while keeping the number
+            # of cells proportional to the number of triangles.
+            cell_size = float(np.median((upper - lower).max(axis=1)))
+            if not cell_size > 0:
+                cell_size = float(extent.max()) or 1.
+            cell_size = max(cell_size, float(np.sqrt(np.prod(extent + cell_size) / (4 * len(lower)))))
+            shape = (np.floor(extent / cell_size).astype(np.int64) + 1).tolist()
+
+            # Cells overlapped by the bounding box of each triangle.
+            cell_min = np.floor((lower - origin) / cell_size).astype(np.int64)
+            cell_max = np.floor((upper - origin) / cell_size).astype(np.int64)
+            widths = cell_max[:, 0] - cell_min[:, 0] + 1
+            counts = widths * (cell_max[:, 1] - cell_min[:, 1] + 1)
+            triangle_i = np.repeat(np.arange(len(counts)), counts)
+            k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            cell_x = cell_min[triangle_i, 0] + k % widths[triangle_i]
+            cell_y = cell_min[triangle_i, 1] + k // widths[triangle_i]
+            cell_i = cell_x * shape[1] + cell_y
+
+            order = np.lexsort((triangle_i, cell_i))
+            cell_starts = np.searchsorted(cell_i[order], np.arange(shape[0] * shape[1] + 1))
+            self._triangle_index = origin, cell_size, shape, triangle_i[order], cell_starts
+        return self._triangle_index
+
+    def find_shapes(self, canvas_xs: np.ndarray, canvas_ys: np.ndarray, chunk_size: int = 2 ** 20) -> np.ndarray:
+        """
+        Look up shapes based on arrays of canvas coordinates.
+
+        Equivalent to calling `find_shape` for each point, but points are
+        tested using NumPy against the tesselated triangles overlapping the
+        same cell of a uniform grid.  Points on the edge (or vertex) of a
+        triangle may touch several shapes, so they are looked up with
+        `find_shape` to pick the same shape.
+
+        Returns
+        -------
+        numpy.ndarray
+            Shape identifier of the shape containing each point (or `None`, if
+            no shape intersects with the corresponding point).
+        """
+        canvas_points = np.column_stack([canvas_xs, canvas_ys, np.ones(len(canvas_xs))])
+        shape_points = canvas_points.dot(np.asarray(self.canvas_to_shapes_transform).T)[:, :2]
+
+        shapes = np.full(shape_points.shape[0], None, dtype=object)
+        if not self.triangles.shape[0]:
+            return shapes
+
+        origin, cell_size, (n_x, n_y), cell_triangles, cell_starts = self._get_triangle_index()
+        point_cells = np.floor((shape_points - origin) / cell_size)
+        in_grid = ((point_cells >= 0) & (point_cells < (n_x, n_y))).all(axis=1)
+        point_i = np.flatnonzero(in_grid)
+        cell_i = (point_cells[in_grid, 0] * n_y + point_cells[in_grid, 1]).astype(np.int64)
+
+        # Limit number of point/triangle pairs tested at once to bound memory.
+        step = max(1, chunk_size // max(1, int(np.diff(cell_starts).max())))
+        for start in range(0, point_i.shape[0], step):
+            cells = cell_i[start:start + step]
+            counts = cell_starts[cells + 1] - cell_starts[cells]
+            # Pair each point with each candidate triangle in its cell.
+            pair_points = np.repeat(point_i[start:start + step], counts)
+            k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            pair_triangles = cell_triangles[np.repeat(cell_starts[cells], counts) + k]
+
+            p = shape_points[pair_points]
+            a, b, c = (self.triangles[pair_triangles, i] for i in range(3))
+            # Point is inside (or on the edge of) a triangle if it is not on
+            # opposite sides of any two triangle edges.
+            d = np.stack([(b_i[:, 0] - a_i[:, 0]) * (p[:, 1] - a_i[:, 1]) -
+                          (b_i[:, 1] - a_i[:, 1]) * (p[:, 0] - a_i[:, 0])
+                          for a_i, b_i in ((a, b), (b, c), (c, a))])
+            inside = ~((d < 0).any(axis=0) & (d > 0).any(axis=0))
+            hits = np.flatnonzero(inside)
+            # Pairs are ordered by point, then by triangle, so take the first
+            # triangle containing each point.
+            found, first = np.unique(pair_points[hits], return_index=True)
+            shapes[found] = self.triangle_shapes[pair_triangles[hits[first]]]
+            on_edge = inside & (d == 0).any(axis=0)
+            for i in np.unique(pair_points[on_edge]):
+                shapes[i] = self.find_shape(*canvas_points[i, :2])
+        return shapes
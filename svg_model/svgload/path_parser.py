@@ -251,8 +251,9 @@ class PathParser:
         (0, 0, 255)
         >>> len(svg_path.loops)
         1
-        >>> svg_path.loops[0].verts
-        [(534.07239, 261.47322), (534.07239, 269.65826), (525.933, 85), (525.93385, 261.47322)]
+        >>> import numpy as np
+        >>> np.round(svg_path.loops[0].verts.astype(float), 3).tolist()
+        [[534.072, 261.473], [534.072, 269.658], [525.933, 85.0], [525.934, 261.473]]
 
         Note that only absolute commands (i.e., uppercase) are currently supported.  For example:
         paths will throw a ParseError exception.  For example:
@@ -22,9 +22,12 @@ SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PRO
 SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
 WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import warnings
 
 from lxml import etree
+import numpy as np
 
 from path_helpers import path
 
@@ -33,11 +36,80 @@ from ..loop import Loop
 from ..geo_path import Path
 
 
+_SVG_NAMESPACE = 'http://www.w3.org/2000/svg'
+_SVG_TAG = f'{{{_SVG_NAMESPACE}}}svg'
+_G_TAG = f'{{{_SVG_NAMESPACE}}}g'
+_PATH_TAG = f'{{{_SVG_NAMESPACE}}}path'
+
+# Largest offset of the center of a parsed SVG from the origin for which the
+# SVG is considered to be centered.
+CENTER_TOLERANCE = 1e-9
+
+
+def iter_path_tags(xml_root):
+    """
+    Iterate through `<path>` elements at the top level of the `<svg>` root
+    element or of a top level `<g>` element, in document order.
+    """
+    root = xml_root.getroottree().getroot() if etree.iselement(xml_root) else xml_root.getroot()
+    if root.tag != _SVG_TAG:
+        return
+    for child in root.iterchildren(_PATH_TAG, _G_TAG):
+        if child.tag == _PATH_TAG:
+            yield child
+        else:
+            yield from child.iterchildren(_PATH_TAG)
+
+
+def iterparse_path_tags(source):
+    """
+    Iterate through the `<path>` elements selected by :func:`iter_path_tags`,
+    streaming them from the given file instead of building the full document
+    tree.
+
+    Each element is cleared (along with its preceding siblings) once the next
+    element is requested.
+    """
+    # Skip collecting ids and whitespace-only text, which are not used, and
+    # allow large text nodes (e.g., embedded images).
+    for _, path_tag in etree.iterparse(source, events=('end',), tag=_PATH_TAG, collect_ids=False,
+                                       remove_blank_text=True, huge_tree=True):
+        parent = path_tag.getparent()
+        if parent is not None and parent.tag == _G_TAG:
+            parent = parent.getparent()
+        if parent is not None and parent.tag == _SVG_TAG and parent.getparent() is None:
+            yield path_tag
+        # Free elements that have been parsed.
+        path_tag.clear()
+        while path_tag.getprevious() is not None:
+            del path_tag.getparent()[0]
+
+
 class SvgParseError(Exception):
     pass
 
 
+def _is_ignored(category: type) -> bool:
+    """
+    Return whether warnings of the specified category are ignored by the
+    current warning filters, regardless of message text or location.
+
+    Returns ``False`` if the first filter matching the category also
+    depends on the message text or location.
+    """
+    for action, message, filter_category, module, lineno in warnings.filters:
+        if not issubclass(category, filter_category):
+            continue
+        if message is not None or module is not None or lineno:
+            return False
+        return action == 'ignore'
+    return False
+
+
 def parse_warning(*args):
+    if _is_ignored(RuntimeWarning):
+        # Skip formatting (i.e., serializing the tag) a discarded warning.
+        return
     filename, tag, message = args
     msg = f'Error parsing {filename}:{tag.sourceline}, {message}\n    {etree.tostring(tag)}'
     if filename:
@@ -50,46 +122,145 @@ class Svg:
     Maintains an ordered list of paths, each one corresponding to a path tag
     from an SVG file. Creates a pylget Batch containing all these paths, for
     rendering as a single OpenGL GL_TRIANGLES indexed vert primitive.
+
+    Vertices and properties derived from them (e.g., the bounding box) are
+    cached, and reset when paths are added, replaced or offset (see
+    :meth:`Path.offset`).  Vertices modified in place (e.g., through
+    :attr:`vert_array`, or by offsetting a single loop) do not reset cached
+    properties.
     """
 
     def __init__(self):
         self.paths = {}
         self.color = (0, 0, 0)
+        # Vertices of all paths in a single `(2, N)` buffer (see `Path._xy`),
+        # pooled on first request.
+        self._xy = None
+        # Bounds `(min_x, min_y, max_x, max_y)` of all paths, computed on
+        # first request.
+        self._bbox_cache = None
+        # Center `(x, y)` of the boundary, computed on first request.
+        self._center_cache = None
+        # Paths (and their revisions) from which the cached properties were
+        # computed.
+        self._cache_paths = ()
+        self._cache_revisions = ()
 
     def add_path(self, id_: str, path_: Path) -> None:
         self.paths[id_] = path_
 
+    def _validate_cache(self) -> None:
+        """
+        Reset cached properties if paths have been added, replaced or offset
+        since they were computed.
+        """
+        paths = tuple(self.paths.values())
+        revisions = tuple(svg_path._revision for svg_path in paths)
+        if paths != self._cache_paths:
+            self._xy = None
+        if paths != self._cache_paths or revisions != self._cache_revisions:
+            self._bbox_cache = None
+            self._center_cache = None
+        self._cache_paths = paths
+        self._cache_revisions = revisions
+
+    def __getstate__(self) -> dict:
+        # Path vertices are pickled separately from the pool, so pool them
+        # again when next requested.
+        state = self.__dict__.copy()
+        state['_xy'] = None
+        return state
+
     def add_to_batch(self, batch):
         """
         Adds paths to the given batch object. They are all added as
         GL_TRIANGLES, so the batch will aggregate them all into a single OpenGL
         primitive.
         """
-        for name in self.paths:
-            svg_path = self.paths[name]
+        for svg_path in self.paths.values():
             svg_path.add_to_batch(batch)
 
+    def _verts_array(self) -> np.ndarray:
+        """
+        Return the vertices of all paths as a single `(2, N)` array of `x`
+        and `y` coordinates.
+
+        The array is pooled on first request, and the vertices of each path
+        are rebound to a view into the array (see `Path._bind_verts`).
+        """
+        self._validate_cache()
+        if self._xy is None:
+            paths = list(self.paths.values())
+            self._xy = np.concatenate([svg_path._xy for svg_path in paths]
+                                      or [np.empty((2, 0), dtype=Loop.dtype)], axis=1)
+            start = 0
+            for svg_path in paths:
+                stop = start + svg_path._xy.shape[1]
+                svg_path._bind_verts(self._xy[:, start:stop])
+                start = stop
+        return self._xy
+
+    @property
+    def vert_array(self) -> np.ndarray:
+        """
+        Vertices of all paths as a `(N, 2)` array of `(x, y)` coordinates, in
+        path order.
+
+        The array is a view of the pooled vertex storage (see
+        `Loop.verts`), so modifying it in place does not reset cached path
+        properties.
+        """
+        return self._verts_array().T
+
+    def offset(self, x: float, y: float) -> None:
+        """
+        Offset the vertices of all paths by the given x and y values.
+        """
+        # Translate the vertices of all paths at once.
+        xy = self._verts_array()
+        xy[0] += x
+        xy[1] += y
+        for svg_path in self.paths.values():
+            svg_path._offset_cache(x, y)
+        if self._bbox_cache is not None:
+            # Translate cached bounds along with the vertices.
+            min_x, min_y, max_x, max_y = self._bbox_cache
+            self._bbox_cache = min_x + x, min_y + y, max_x + x, max_y + y
+        if self._center_cache is not None:
+            center_x, center_y = self._center_cache
+            self._center_cache = center_x + x, center_y + y
+
     def get_bounding_box(self) -> Loop:
-        points = list(self.all_verts())
-        x_vals = [x for x, y in points]
-        y_vals = [y for x, y in points]
-        min_x, min_y = min(x_vals), min(y_vals)
-        max_x, max_y = max(x_vals), max(y_vals)
+        self._validate_cache()
+        if self._bbox_cache is None:
+            xy = self._verts_array()
+            if not xy.shape[1]:
+                raise ValueError('SVG has no vertices.')
+            self._bbox_cache = (*xy.min(axis=1).tolist(), *xy.max(axis=1).tolist())
+        min_x, min_y, max_x, max_y = self._bbox_cache
+        # Return a new loop, since the loop vertices may be modified in place.
         return Loop([(min_x, min_y), (min_x, max_y), (max_x, max_y),
                      (max_x, min_y)])
 
     def get_boundary(self) -> Path:
-        if 'boundary' in self.paths:
-            boundary = self.paths['boundary']
-        else:
+        boundary = self.paths.get('boundary')
+        if boundary is None:
             boundary = Path([self.get_bounding_box()])
         return boundary
 
+    def get_center(self) -> tuple[float, float]:
+        """
+        Return the center of the boundary (see :meth:`get_boundary`).
+        """
+        self._validate_cache()
+        if self._center_cache is None:
+            self._center_cache = self.get_boundary().get_center()
+        return self._center_cache
+
     def all_verts(self):
-        for svg_path in self.paths.values():
-            for loop in svg_path.loops:
-                for vert in loop.verts:
-                    yield vert
+        # Iterate `(x, y)` tuples of the pooled vertices of all paths (see
+        # `vert_array`), without creating an array view per vertex.
+        return zip(*self._verts_array().tolist())
 
 
 class SvgParser:
@@ -99,26 +270,49 @@ class SvgParser:
 
     def __init__(self):
         self.filename = None
+        self.path_parser = PathParser()
 
     def parse_file(self, filename: str, on_error=None) -> Svg:
         self.filename = path(filename)
-        xml_root = etree.parse(self.filename)
-        return self.parse(xml_root, on_error)
+        return self._make_svg(self._parse_path_tags(iterparse_path_tags(self.filename), on_error))
 
-    def parse(self, xml_root, on_error=None) -> Svg:
+    def parse_files(self, filenames, on_error=None, workers: int = None) -> list[Svg]:
         """
-        Parse all <path> elements from xml_root.
+        Parse each of the given files, returning a list of Svg objects.
+
+        Parameters
+        ----------
+        filenames : list
+            Paths of SVG files.
+        on_error : function, optional
+            Called with the filename, path tag and message of each path that
+            cannot be parsed.  Must be picklable (e.g., a module level
+            function) if :data:`workers` is specified.
+        workers : int, optional
+            If specified, parse files in parallel using a pool of the
+            specified number of processes.
         """
-        svg = Svg()
-        svg_namespace = {'svg': 'http://www.w3.org/2000/svg'}
-        path_tags = xml_root.xpath('(/svg:svg|/svg:svg/svg:g)/svg:path',
-                                   namespaces=svg_namespace)
-        parser = PathParser()
+        if workers is None:
+            return [self.parse_file(filename, on_error) for filename in filenames]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_parse_file, filenames, repeat(on_error)))
+
+    def iter_paths(self, xml_root, on_error=None):
+        """
+        Parse <path> elements from xml_root, yielding an `(id, path)` tuple
+        for each non-empty path as it is parsed.
+        """
+        return self._parse_path_tags(iter_path_tags(xml_root), on_error)
+
+    def _parse_path_tags(self, path_tags, on_error=None):
+        parser = self.path_parser
+        # Number paths without an id from the start of each document.
+        parser.next_id = PathParser.next_id
         for path_tag in path_tags:
             try:
                 id, svg_path = parser.parse(path_tag)
                 if svg_path.loops:
-                    svg.add_path(id, svg_path)
+                    yield id, svg_path
             except ParseError as why:
                 filename = getattr(self, 'filename', None)
                 args = (filename, path_tag, why.message)
@@ -127,8 +321,29 @@ class SvgParser:
                 else:
                     raise SvgParseError(*args)
 
+    def parse(self, xml_root, on_error=None) -> Svg:
+        """
+        Parse all <path> elements from xml_root.
+        """
+        return self._make_svg(self.iter_paths(xml_root, on_error))
+
+    def _make_svg(self, paths) -> Svg:
+        """
+        Return an Svg object containing the given `(id, path)` tuples,
+        centered on the origin.
+        """
+        svg = Svg()
+        for id, svg_path in paths:
+            svg.add_path(id, svg_path)
+
         if svg.paths:
-            x, y = svg.get_boundary().get_center()
-            for svg_path in svg.paths.values():
-                svg_path.offset(-x, -y)
+            x, y = svg.get_center()
+            # Skip translating vertices of an SVG that is already centered.
+            if abs(x) >= CENTER_TOLERANCE or abs(y) >= CENTER_TOLERANCE:
+                svg.offset(-x, -y)
         return svg
+
+
+def _parse_file(filename: str, on_error=None) -> Svg:
+    # Parse a single file in a worker process (see `SvgParser.parse_files`).
+    return SvgParser().parse_file(filename, on_error)
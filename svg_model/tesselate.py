@@ -48,8 +48,8 @@ def tesselate_shapes_frame(df_shapes: pd.DataFrame, shape_i_columns: Union[str,
             print(f"Error during triangulation: {e}")
             import pdb; pdb.set_trace()
             continue
-        if not isinstance(shape_i, (list, tuple)):
-            shape_i = [shape_i]
+        # Group keys are tuples when grouping by a list of columns.
+        shape_i = list(shape_i) if isinstance(shape_i, (list, tuple)) else [shape_i]
 
         for i, triangle_i in enumerate(triangulator.triangles()):
             triangle_points_i = [shape_i + [i] + [j, x, y] for j, (x, y) in enumerate(triangle_i)]
@@ -0,0 +1,26 @@
+# coding: utf-8
+import numpy as np
+import pandas as pd
+
+from svg_model.connections import extract_adjacent_shapes
+
+
+def _squares(missing=False):
+    # Row of three adjacent 10x10 squares.
+    df_shapes = pd.DataFrame([(id_, k, x + 10. * i, float(y)) for i, id_ in enumerate('abc')
+                              for k, (x, y) in enumerate([(0, 0), (10, 0), (10, 10), (0, 10)])],
+                             columns=['id', 'vertex_i', 'x', 'y'])
+    if missing:
+        # Append a vertex with a missing coordinate to the middle square.
+        df_shapes.loc[len(df_shapes)] = ['b', 4, np.nan, 5.]
+    return df_shapes
+
+
+def test_extract_adjacent_shapes():
+    df_connected = extract_adjacent_shapes(_squares(), 'id', extend=1.)
+    assert df_connected.values.tolist() == [['a', 'b'], ['b', 'c']]
+
+
+def test_extract_adjacent_shapes_skips_missing_coordinates():
+    df_connected = extract_adjacent_shapes(_squares(missing=True), 'id', extend=1.)
+    assert df_connected.values.tolist() == [['a', 'b'], ['b', 'c']]
@@ -0,0 +1,23 @@
+# coding: utf-8
+import numpy as np
+import pandas as pd
+
+from svg_model import scale_points
+
+
+def test_scale_points_skips_missing_coordinates():
+    df_points = pd.DataFrame({'x': [10., np.nan, 30.], 'y': [5., 15., np.nan]})
+    df_scaled = scale_points(df_points, scale=2.)
+
+    np.testing.assert_array_equal(df_scaled.x, [0., np.nan, 10.])
+    np.testing.assert_array_equal(df_scaled.y, [0., 5., np.nan])
+    # Input frame is unmodified.
+    np.testing.assert_array_equal(df_points.x, [10., np.nan, 30.])
+
+
+def test_scale_points_empty_frame():
+    df_points = pd.DataFrame({'x': [], 'y': []}, dtype=float)
+    df_scaled = scale_points(df_points)
+
+    assert df_scaled.empty
+    assert df_scaled.columns.tolist() == ['x', 'y']
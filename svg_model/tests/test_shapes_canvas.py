@@ -0,0 +1,58 @@
+# coding: utf-8
+import time
+
+import numpy as np
+import pandas as pd
+
+from svg_model.shapes_canvas import ShapesCanvas
+
+
+def _shapes_canvas():
+    # Two adjacent squares and a triangle sharing edges and vertices.
+    shapes = {'a': [(0, 0), (30, 0), (30, 30), (0, 30)],
+              'b': [(30, 0), (60, 0), (60, 30), (30, 30)],
+              'c': [(0, 30), (60, 30), (30, 60)]}
+    df_shapes = pd.DataFrame([(id_, vertex_i, x, y) for id_, vertices in shapes.items()
+                              for vertex_i, (x, y) in enumerate(vertices)],
+                             columns=['id', 'vertex_i', 'x', 'y'])
+    return ShapesCanvas(df_shapes, 'id')
+
+
+def test_find_shapes_matches_find_shape():
+    canvas = _shapes_canvas()
+    # Vertices, points on edges, interior points and points outside all shapes.
+    points = np.array([(0, 0), (30, 0), (60, 0), (0, 30), (30, 30), (60, 30), (30, 60),
+                       (15, 0), (30, 15), (15, 30), (45, 30), (45, 45), (15, 45),
+                       (10, 10), (50, 20), (30, 50), (-5, 10), (70, 70)], dtype=float)
+    # Look up the same points in canvas coordinates.
+    canvas_points = np.column_stack([points, np.ones(len(points))])
+    canvas_points = canvas_points.dot(np.asarray(canvas.shapes_to_canvas_transform).T)[:, :2]
+
+    expected = [canvas.find_shape(x, y) for x, y in canvas_points]
+    assert canvas.find_shapes(*canvas_points.T).tolist() == expected
+    assert expected[-2:] == [None, None]
+
+
+def test_find_shapes_scales_with_shape_count():
+    # Grid of 40x40 adjacent squares (i.e., 3200 tesselated triangles).
+    n = 40
+    df_shapes = pd.DataFrame([(f'{i}_{j}', k, 10. * x, 10. * y) for i in range(n) for j in range(n)
+                              for k, (x, y) in enumerate([(i, j), (i + 1, j), (i + 1, j + 1), (i, j + 1)])],
+                             columns=['id', 'vertex_i', 'x', 'y'])
+    canvas = ShapesCanvas(df_shapes, 'id')
+    points = np.random.default_rng(0).uniform(-5, 10 * n + 5, (10000, 2))
+    # Include shared vertices of adjacent squares.
+    points[:500] = np.round(points[:500] / 10) * 10
+
+    start = time.perf_counter()
+    shapes = canvas.find_shapes(*points.T)
+    batch_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = [canvas.find_shape(x, y) for x, y in points]
+    duration = time.perf_counter() - start
+
+    assert shapes.tolist() == expected
+    # Points are only tested against nearby triangles, so the batched lookup
+    # must be faster than looking up each point (testing every point against
+    # every triangle is an order of magnitude slower).
+    assert batch_duration < duration